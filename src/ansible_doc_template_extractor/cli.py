@@ -20,14 +20,16 @@ import argparse
 import sys
 import pathlib
 import json
+import io
+import functools
+import concurrent.futures
+import contextvars
+import hashlib
 
-import jinja2
-import yaml
-import jsonschema
-import jinja2_ansible_filters
-from antsibull_docs_parser.parser import parse, Context
-from antsibull_docs_parser.rst import to_rst
-from antsibull_docs_parser.md import to_md
+# Note: The packages for templating, YAML loading, schema validation and
+# Ansible markup parsing are imported in the functions that use them, so
+# that options such as --help or --version do not pay for importing them.
+# pylint: disable=import-outside-toplevel
 
 try:
     from ._version_scm import version
@@ -44,6 +46,35 @@ DEFAULT_OUT_DIR_STR = \
 
 LIST_STARTERS = ("*", "-", "#")
 
+# Pattern for detecting YAML file content that may be in JSON format.
+JSON_START_PATTERN = re.compile(r"\s*[\[{]")
+
+# Pattern for detecting JSON content that orjson and the YAML loaders may
+# load differently: Numbers with exponents (e.g. 1e3 is a string in YAML 1.1),
+# integers with 19 or more digits (loaded as float by orjson if they exceed
+# 64 bits), escape sequences (e.g. surrogate pairs), tabs (rejected by the
+# pure Python YAML loader), C1 control characters including DEL (rejected by
+# YAML, except for NEL which YAML treats as a line break) and the U+FFFE and
+# U+FFFF non-characters (rejected by YAML). Such content is always loaded as
+# YAML.
+JSON_YAML_DIFF_PATTERN = re.compile(
+    r"[0-9][eE]|[0-9]{19}|[\\\t\x7f-\x9f\ufffe\uffff]")
+
+# Maximum number of cached results of the to_rst and to_md filters.
+TEXT_CACHE_SIZE = 4096
+
+# Messages of the spec file that is processed in the current context, if the
+# messages are collected for printing them later, or None if messages are
+# printed directly. See print_message().
+COLLECTED_MESSAGES = contextvars.ContextVar(
+    "collected_messages", default=None)
+
+# File name pattern for the Jinja2 bytecode cache files of this program.
+# Jinja2 keys the cache entries only on the template and its source, so the
+# pattern includes a hash of the program version and the Jinja2 environment
+# options (see get_bytecode_cache()).
+BYTECODE_CACHE_PATTERN = "__ansible_doc_template_extractor_{key}_%s.cache"
+
 # Directory separator related patterns.
 # Note: On Windows, the separator can be '/' or '\', so we need to allow for
 # both and cannot just use os.sep.
@@ -266,17 +297,26 @@ class Error(Exception):
     pass
 
 
+def print_message(message):
+    """
+    Print a message, or add it to the collected messages of the spec file that
+    is processed in the current context, if messages are collected.
+    """
+    messages = COLLECTED_MESSAGES.get()
+    if messages is None:
+        print(message)
+    else:
+        messages.append(message)
+
+
 def template_error_msg(filename, exc):
     """
     Return an error message for printing, from a Jinja2 TemplateError exception.
     """
-    assert isinstance(exc, jinja2.TemplateError)
-    if hasattr(exc, 'lineno'):
-        line_txt = f", line {exc.lineno}"
-    else:
-        line_txt = ""
+    lineno = getattr(exc, 'lineno', None)
+    line_txt = f", line {lineno}" if lineno is not None else ""
     return (f"Could not render template file {filename}{line_txt}: "
-            f"{exc.__class__.__name__}: {exc}")
+            f"{type(exc).__name__}: {exc}")
 
 
 def normalized_text(text):
@@ -308,20 +348,112 @@ def normalized_text(text):
     return normalized_str
 
 
-def to_rst_filter(text):
+@functools.lru_cache(maxsize=None)
+def parse_context():
     """
-    Jinja2 filter that converts text to RST, resolving Ansible specific
-    constructs such as "C(...)".
+    Return the context for parsing Ansible markup in texts.
+
+    Context is an immutable named tuple, so a single instance can be shared by
+    all parse() calls.
+    """
+    from antsibull_docs_parser.parser import Context
+    return Context()
+
+
+@functools.lru_cache(maxsize=None)
+def yaml_loader():
+    """
+    Return the YAML safe loader class to be used.
+
+    The LibYAML based loader is used if PyYAML was built with LibYAML.
     """
     try:
-        parsed_items = parse(text, Context(), errors="exception")
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    return SafeLoader
+
+
+@functools.lru_cache(maxsize=None)
+def orjson_module():
+    """
+    Return the orjson module, or None if the optional orjson package for
+    faster loading of files in JSON format is not installed.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def convert_text(text, to_format, format_name):
+    """
+    Convert text to a target format, resolving Ansible specific constructs
+    such as "C(...)".
+
+    Parameters:
+
+      text (str or list of str): Text to be converted.
+
+      to_format (callable): antsibull-docs-parser function that converts the
+        parsed text to the target format.
+
+      format_name (str): Name of the target format, for messages.
+
+    Returns:
+
+      str: Converted text.
+
+    Raises:
+
+      Error: Parsing the text failed.
+    """
+    from antsibull_docs_parser.parser import parse
+    try:
+        parsed_items = parse(text, parse_context(), errors="exception")
     except ValueError as exc:
-        raise Error(f"Cannot parse text as RST: {exc}") from exc
-    rst_text = to_rst(parsed_items)
+        raise Error(f"Cannot parse text as {format_name}: {exc}") from exc
+    out_text = to_format(parsed_items)
     for c in LIST_STARTERS:
-        rst_text = rst_text.replace(f"\\{c}", c)
-    rst_text = normalized_text(rst_text)
-    return rst_text
+        out_text = out_text.replace(f"\\{c}", c)
+    out_text = normalized_text(out_text)
+    return out_text
+
+
+def text_to_rst(text):
+    """
+    Convert text to RST, resolving Ansible specific constructs such as
+    "C(...)".
+    """
+    from antsibull_docs_parser.rst import to_rst
+    return convert_text(text, to_rst, "RST")
+
+
+def text_to_md(text):
+    """
+    Convert text to Markdown, resolving Ansible specific constructs such as
+    "C(...)".
+    """
+    from antsibull_docs_parser.md import to_md
+    return convert_text(text, to_md, "Markdown")
+
+
+# Cached versions of the text conversion functions, for string input.
+# Spec files tend to contain many repeated texts (e.g. in the descriptions of
+# options and suboptions).
+cached_text_to_rst = functools.lru_cache(maxsize=TEXT_CACHE_SIZE)(text_to_rst)
+cached_text_to_md = functools.lru_cache(maxsize=TEXT_CACHE_SIZE)(text_to_md)
+
+
+def to_rst_filter(text):
+    """
+    Jinja2 filter that converts text to RST, resolving Ansible specific
+    constructs such as "C(...)".
+    """
+    if isinstance(text, str):
+        return cached_text_to_rst(text)
+    return text_to_rst(text)
 
 
 def to_md_filter(text):
@@ -329,15 +461,9 @@ def to_md_filter(text):
     Jinja2 filter that converts text to Markdown, resolving Ansible specific
     constructs such as "C(...)".
     """
-    try:
-        parsed_items = parse(text, Context(), errors="exception")
-    except ValueError as exc:
-        raise Error(f"Cannot parse text as Markdown: {exc}") from exc
-    md_text = to_md(parsed_items)
-    for c in LIST_STARTERS:
-        md_text = md_text.replace(f"\\{c}", c)
-    md_text = normalized_text(md_text)
-    return md_text
+    if isinstance(text, str):
+        return cached_text_to_md(text)
+    return text_to_md(text)
 
 
 def load_schema_file_function(schema_file, base_file, kind):
@@ -367,9 +493,11 @@ def load_schema_file_function(schema_file, base_file, kind):
 
       Error: Loading or validation failed.
     """
+    import jsonschema
+
     schema_file = pathlib.Path(base_file).parent / schema_file
 
-    print(f"Loading schema file for {kind}: {schema_file}")
+    print_message(f"Loading schema file for {kind}: {schema_file}")
 
     if schema_file.suffix == ".json":
         try:
@@ -380,25 +508,18 @@ def load_schema_file_function(schema_file, base_file, kind):
     elif schema_file.suffix in {".yml", ".yaml"}:
         try:
             with schema_file.open(encoding="utf-8") as f:
-                schema = yaml.safe_load(f)
-        except (IOError, yaml.YAMLError) as exc:
+                schema = load_yaml_stream(f, f"Schema file for {kind}")
+        except IOError as exc:
             raise Error(str(exc)) from exc
     else:
         raise Error(
             f"Schema file for {kind} has an unsupported suffix: {schema_file}")
 
-    print(f"Validating schema for {kind} against JSON meta-schema")
+    print_message(f"Validating schema for {kind} against JSON meta-schema")
     try:
         jsonschema.Draft202012Validator.check_schema(schema)
     except jsonschema.SchemaError as exc:
-        elem_path = get_path(exc.absolute_path)
-        schema_path = get_path(exc.absolute_schema_path)
-        raise Error(
-            f"The JSON schema in {schema_file} is invalid; schema element "
-            f"{elem_path!r} violates the JSON meta-schema: {exc.message}. "
-            f"Details: Meta-schema item: {schema_path}, "
-            f"Meta-schema validator: {exc.validator}={exc.validator_value}"
-        )
+        raise Error(schema_error_msg(schema_file, exc))
 
     return schema
 
@@ -416,6 +537,20 @@ def get_path(path_list):
     return path_str.lstrip(".")
 
 
+def schema_error_msg(schema_file, exc):
+    """
+    Return an error message for printing, from a jsonschema SchemaError
+    exception for an invalid JSON schema.
+    """
+    elem_path = get_path(exc.absolute_path)
+    schema_path = get_path(exc.absolute_schema_path)
+    return (
+        f"The JSON schema in {schema_file} is invalid; schema element "
+        f"{elem_path!r} violates the JSON meta-schema: {exc.message}. "
+        f"Details: Meta-schema item: {schema_path}, "
+        f"Meta-schema validator: {exc.validator}={exc.validator_value}")
+
+
 def validate(data, schema, data_file, schema_file, data_kind):
     """
     Validate a data object (e.g. dict loaded from JSON or YAML) against
@@ -438,19 +573,14 @@ def validate(data, schema, data_file, schema_file, data_kind):
 
       Error: Validation failed
     """
+    import jsonschema
+
     try:
         jsonschema.validate(
             data, schema,
             format_checker=jsonschema.Draft202012Validator.FORMAT_CHECKER)
     except jsonschema.SchemaError as exc:
-        elem_path = get_path(exc.absolute_path)
-        schema_path = get_path(exc.absolute_schema_path)
-        raise Error(
-            f"The JSON schema in {schema_file} is invalid; schema element "
-            f"{elem_path!r} violates the JSON meta-schema: {exc.message}. "
-            f"Details: Meta-schema item: {schema_path}, "
-            f"Meta-schema validator: {exc.validator}={exc.validator_value}"
-        )
+        raise Error(schema_error_msg(schema_file, exc))
     except jsonschema.ValidationError as exc:
         elem_path = get_path(exc.absolute_path)
         schema_path = get_path(exc.absolute_schema_path)
@@ -462,6 +592,45 @@ def validate(data, schema, data_file, schema_file, data_kind):
         )
 
 
+def load_yaml_stream(fp, kind):
+    """
+    Load YAML from an open text file and return its content as an object
+    (usually dict).
+
+    The kind of YAML file is used for messages.
+
+    If the orjson package is installed and the file content looks like JSON,
+    the content is first loaded with orjson, which is faster than loading it
+    as YAML. If that fails, the content is loaded as YAML. Content for which
+    orjson and the YAML loader may produce different results is always loaded
+    as YAML, so the result does not depend on whether orjson is installed.
+
+    Raises:
+
+      Error: Invalid YAML syntax.
+    """
+    import yaml
+
+    text = fp.read()
+
+    orjson = orjson_module()
+    if orjson is not None and JSON_START_PATTERN.match(text) and \
+            not JSON_YAML_DIFF_PATTERN.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+    # The stream gets the file name so that YAML error messages show it
+    stream = io.StringIO(text)
+    stream.name = getattr(fp, "name", "<file>")
+    try:
+        return yaml.load(stream, Loader=yaml_loader())  # nosec: B506
+    except yaml.YAMLError as exc:
+        exc_str = str(exc).replace('\n', '; ')
+        raise Error(f"{kind} has invalid YAML syntax: {exc_str}")
+
+
 def load_yaml_file(kind, yaml_file, schema_file=None, verbose=False):
     """
     Load a YAML file and return its content as an object (usually dict).
@@ -487,91 +656,122 @@ def load_yaml_file(kind, yaml_file, schema_file=None, verbose=False):
 
       Error: Loading or validation failed.
     """
-
     if verbose:
-        print(f"Loading {kind}: {yaml_file}")
+        print_message(f"Loading {kind}: {yaml_file}")
     try:
         with open(yaml_file, 'r', encoding='utf-8') as fp:
-            yaml_obj = yaml.safe_load(fp)
+            yaml_obj = load_yaml_stream(fp, kind)
     except (IOError, OSError) as exc:
         raise Error(
             f"{kind} cannot be opened for reading: {exc}")
-    except (yaml.scanner.ScannerError, yaml.parser.ParserError) as exc:
-        exc_str = str(exc).replace('\n', '; ')
-        raise Error(
-            f"{kind} has invalid YAML syntax: {exc_str}")
 
     if schema_file:
 
         if verbose:
-            print(f"Loading schema file for {kind}: {schema_file}")
+            print_message(f"Loading schema file for {kind}: {schema_file}")
         try:
             with open(schema_file, 'r', encoding='utf-8') as fp:
-                schema_obj = yaml.safe_load(fp)
+                schema_obj = load_yaml_stream(fp, f"Schema file for {kind}")
         except (IOError, OSError) as exc:
             raise Error(
                 f"Schema file for {kind} cannot be opened for reading: {exc}")
-        except (yaml.scanner.ScannerError, yaml.parser.ParserError) as exc:
-            exc_str = str(exc).replace('\n', '; ')
-            raise Error(
-                f"Schema file for {kind} has invalid YAML syntax: {exc_str}")
 
         if verbose:
-            print(f"Validating {kind} against its schema file")
+            print_message(f"Validating {kind} against its schema file")
         validate(yaml_obj, schema_obj, yaml_file, schema_file, kind)
 
     return yaml_obj
 
 
-def create_output_file(parser, args, spec_file):
+def get_bytecode_cache(env_options):
     """
-    Create the output file for one spec file.
+    Return a Jinja2 bytecode cache that persists compiled templates across
+    program invocations, or None if no safe cache directory can be determined.
+
+    The cache is stored in a user-specific directory in the system temp
+    directory. Cache entries are invalidated by Jinja2 when the template source
+    changes. The cache file names include a hash of the versions of this
+    program and of Jinja2 and of the Jinja2 environment options, so that a
+    change of any of them does not use compiled templates from the cache that
+    were compiled differently.
+
+    Parameters:
+
+      env_options (dict): Keyword arguments for creating the Jinja2
+        environment, except for the loader and the bytecode cache.
     """
+    import jinja2
 
-    verbose = args.verbose
-    out_dir = args.out_dir
-    out_format = args.format
+    key_str = repr((version, jinja2.__version__, sorted(env_options.items())))
+    key = hashlib.sha256(key_str.encode("utf-8")).hexdigest()[:16]
+    try:
+        return jinja2.FileSystemBytecodeCache(
+            pattern=BYTECODE_CACHE_PATTERN.format(key=key))
+    except (RuntimeError, OSError):
+        return None
 
-    if args.type:
-        spec_type = args.type
-    else:
-        if ROLE_SPEC_FILE_PATTERN.search(spec_file):
-            spec_type = "role"
-        elif PLAYBOOK_SPEC_FILE_PATTERN.search(spec_file):
-            spec_type = "playbook"
-        else:
-            spec_type = "other"
 
-    if args.ext:
-        out_ext = args.ext.strip(".")
-    else:
-        # Arg check ensured that format is not 'other'
-        out_ext = out_format
+def load_template(template_file, templates, verbose=False, builtin=False):
+    """
+    Load a Jinja2 template file and return the compiled template.
 
-    if args.template:
-        template_file = args.template
-    else:
-        # Arg check ensured that format is not 'other'
-        if spec_type == "other":
-            parser.error("for type 'other', the --template option is required.")
-        my_dir = os.path.dirname(__file__)
-        template_file = os.path.join(
-            my_dir, "templates", f"{spec_type}.{out_format}.j2")
+    The compiled template is cached in the templates dict, so that a template
+    file that is used for multiple spec files is loaded and compiled only once.
+
+    Parameters:
+
+      template_file (str): Path name of the Jinja2 template file, or for
+        built-in template files, their name within the package (e.g.
+        "role.md.j2").
+
+      templates (dict): Cache of compiled templates, by tuple
+        (template_file, builtin).
+
+      verbose (bool): Print verbose messages.
+
+      builtin (bool): The template file is a built-in template file of this
+        package. Built-in template files are loaded as package resources.
+
+    Returns:
+
+      jinja2.Template: The compiled template.
+
+    Raises:
+
+      Error: Loading or compiling the template failed.
+    """
+    template = templates.get((template_file, builtin))
+    if template is not None:
+        return template
+
+    import jinja2
+    import jinja2_ansible_filters
 
     extensions = [
         jinja2_ansible_filters.AnsibleCoreFiltersExtension,
         'jinja2.ext.do'
     ]
 
-    template_dir = os.path.dirname(template_file)
-    if template_dir == "":
-        template_dir = "."
-    template_name = os.path.basename(template_file)
-
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(template_dir),
-        trim_blocks=True, lstrip_blocks=False,
-        autoescape=False, extensions=extensions)  # nosec: B701
+    if builtin:
+        template_name = template_file
+        template_kind = "built-in template file"
+        loader = jinja2.PackageLoader(__package__, "templates")
+    else:
+        template_dir, template_name = os.path.split(template_file)
+        template_kind = "template file"
+        loader = jinja2.FileSystemLoader(template_dir or ".")
+
+    # Autoescaping is disabled, because the output formats are text formats
+    # such as RST and Markdown, where HTML escaping would corrupt the output.
+    env_options = {
+        "trim_blocks": True,
+        "lstrip_blocks": False,
+        "autoescape": False,
+        "extensions": extensions,
+    }
+    env = jinja2.Environment(  # nosec: B701
+        loader=loader, bytecode_cache=get_bytecode_cache(env_options),
+        **env_options)
 
     # Let undefined variables fail rendering
     env.undefined = jinja2.StrictUndefined
@@ -582,34 +782,91 @@ def create_output_file(parser, args, spec_file):
     env.globals["load_schema_file"] = load_schema_file_function
 
     if verbose:
-        print(f"Loading template file: {template_file}")
+        print(f"Loading {template_kind}: {template_file}")
     try:
         template = env.get_template(template_name)
     except jinja2.TemplateNotFound:
+        if builtin:
+            raise Error(
+                f"Could not find built-in template name {template_name}")
         raise Error(
             f"Could not find template name {template_name} in search path: "
             f"{', '.join(env.loader.searchpath)}")
     except jinja2.TemplateSyntaxError as exc:
         raise Error(
-            f"Syntax error in template file {template_file}, "
+            f"Syntax error in {template_kind} {template_file}, "
             f"line {exc.lineno}: {exc.message}")
 
+    templates[(template_file, builtin)] = template
+    return template
+
+
+def prepare_output_file(parser, args, spec_file, templates):
+    """
+    Prepare the creation of the output file for one spec file, by determining
+    the spec type, name, template, output file and schema file, and loading
+    the template.
+
+    The templates dict is used as a cache of compiled templates across the
+    spec files of one program invocation.
+
+    Returns:
+
+      tuple(template, template_file, name, out_file, schema_file): The
+        arguments for write_output_file() after the spec file.
+    """
+    verbose = args.verbose
+    out_dir = args.out_dir
+    out_format = args.format
+
+    # The matches are used for detecting the spec type and the name.
+    # A spec file name cannot match both patterns.
+    role_match = ROLE_SPEC_FILE_PATTERN.search(spec_file)
+    playbook_match = None if role_match else \
+        PLAYBOOK_SPEC_FILE_PATTERN.search(spec_file)
+
+    if args.type:
+        spec_type = args.type
+    else:
+        if role_match:
+            spec_type = "role"
+        elif playbook_match:
+            spec_type = "playbook"
+        else:
+            spec_type = "other"
+
+    if args.ext:
+        out_ext = args.ext.strip(".")
+    else:
+        # Arg check ensured that format is not 'other'
+        out_ext = out_format
+
+    builtin_template = not args.template
+    if args.template:
+        template_file = args.template
+    else:
+        # Arg check ensured that format is not 'other'
+        if spec_type == "other":
+            parser.error("for type 'other', the --template option is required.")
+        template_file = f"{spec_type}.{out_format}.j2"
+
+    template = load_template(
+        template_file, templates, verbose, builtin_template)
+
     name = None  # Avoid pylint possibly-used-before-assignment
     if args.name:
         name = args.name
     else:
         if spec_type == "role":
-            m = ROLE_SPEC_FILE_PATTERN.search(spec_file)
-            if m:
-                name = m.group(2)
+            if role_match:
+                name = role_match.group(2)
             else:
                 parser.error(
                     "For type 'role', the --name option is required if the "
                     "spec file name does not follow the role convention.")
         elif spec_type == "playbook":
-            m = PLAYBOOK_SPEC_FILE_PATTERN.search(spec_file)
-            if m:
-                name = m.group(2)
+            if playbook_match:
+                name = playbook_match.group(2)
             else:
                 parser.error(
                     "For type 'playbook', the --name option is required if the "
@@ -632,27 +889,136 @@ def create_output_file(parser, args, spec_file):
     else:
         schema_file = None
 
+    return template, template_file, name, out_file, schema_file
+
+
+def write_output_file(
+        spec_file, template, template_file, name, out_file, schema_file,
+        verbose=False):
+    """
+    Load one spec file, render the template for it, and write the output file.
+
+    Returns the path name of the created output file.
+    """
+    import jinja2
+
     spec_file_dict = load_yaml_file(
         "spec file", spec_file, schema_file, verbose)
 
+    # The template output is streamed to a temporary file in the output
+    # directory, so that the complete output does not need to be held in
+    # memory. The temporary file replaces the output file only if rendering
+    # succeeds, so that an existing output file is kept if rendering fails.
+    tmp_file = f"{out_file}.{os.getpid()}.tmp"
     try:
-        data = template.render(
-            name=name,
-            spec_file_name=spec_file,
-            spec_file_dict=spec_file_dict)
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as fp:
+                last_chunk = ""
+                for chunk in template.generate(
+                        name=name,
+                        spec_file_name=spec_file,
+                        spec_file_dict=spec_file_dict):
+                    if chunk:
+                        fp.write(chunk)
+                        last_chunk = chunk
+                if not last_chunk.endswith('\n'):
+                    fp.write('\n')
+            os.replace(tmp_file, out_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
     except jinja2.TemplateError as exc:
         raise Error(template_error_msg(template_file, exc))
-
-    if not data.endswith('\n'):
-        data += '\n'
-    try:
-        with open(out_file, 'w', encoding='utf-8') as fp:
-            fp.write(data)
     except IOError as exc:
         raise Error(
             f"Cannot write output file {out_file}: {exc}")
 
-    print(f"Created output file: {out_file}")
+    return out_file
+
+
+def create_output_file(parser, args, spec_file, templates):
+    """
+    Create the output file for one spec file.
+
+    The templates dict is used as a cache of compiled templates across the
+    spec files of one program invocation.
+
+    Returns the path name of the created output file.
+    """
+    prepared = prepare_output_file(parser, args, spec_file, templates)
+    return write_output_file(spec_file, *prepared, args.verbose)
+
+
+def create_output_files(parser, args):
+    """
+    Create the output files for all spec files.
+
+    Normally, all spec files are first prepared one after the other (which
+    includes loading each template once and checking the arguments), and then
+    the spec files are loaded, rendered and written concurrently in a thread
+    pool. The messages of each spec file are collected and printed in the
+    order of the spec files. If processing a spec file fails, the processing
+    of spec files that have not started yet is cancelled, and the exception
+    of the first failed spec file (in the order of the spec files) is raised.
+    Note that output files of later spec files may already have been written
+    at that point.
+
+    If verbose messages are enabled, or if multiple spec files have the same
+    output file (ignoring case), the spec files are processed one after the
+    other.
+    """
+    if args.spec_file and not os.path.isdir(args.out_dir):
+        raise Error(
+            f"Cannot write output files: Output directory {args.out_dir} "
+            "is not an existing directory")
+
+    templates = {}
+
+    if args.verbose:
+        for spec_file in args.spec_file:
+            out_file = create_output_file(parser, args, spec_file, templates)
+            print(f"Created output file: {out_file}")
+        return
+
+    prepared_list = [
+        prepare_output_file(parser, args, spec_file, templates)
+        for spec_file in args.spec_file
+    ]
+
+    # The output file names are compared case-insensitively, because the file
+    # system may be case-insensitive also where os.path.normcase() does not
+    # change the case (e.g. on macOS).
+    out_files = [
+        os.path.normcase(os.path.abspath(prepared[3])).lower()
+        for prepared in prepared_list
+    ]
+    if len(set(out_files)) < len(out_files):
+        for spec_file, prepared in zip(args.spec_file, prepared_list):
+            out_file = write_output_file(spec_file, *prepared)
+            print(f"Created output file: {out_file}")
+        return
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = []
+        for spec_file, prepared in zip(args.spec_file, prepared_list):
+            messages = []
+            context = contextvars.copy_context()
+            context.run(COLLECTED_MESSAGES.set, messages)
+            future = executor.submit(
+                context.run, write_output_file, spec_file, *prepared)
+            futures.append((future, messages))
+        try:
+            for future, messages in futures:
+                try:
+                    out_file = future.result()
+                finally:
+                    for message in messages:
+                        print(message)
+                print(f"Created output file: {out_file}")
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
 
 
 def main():
@@ -680,8 +1046,7 @@ def main():
             "required.")
 
     try:
-        for spec_file in args.spec_file:
-            create_output_file(parser, args, spec_file)
+        create_output_files(parser, args)
     except Error as exc:
         print(f"Error: {exc}", flush=True)
         return 1
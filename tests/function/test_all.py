@@ -20,9 +20,11 @@ import os
 import re
 import tempfile
 import shutil
+import concurrent.futures
 from io import StringIO
 from contextlib import redirect_stdout, redirect_stderr
 import pytest
+import jinja2
 
 from ansible_doc_template_extractor.cli import main
 
@@ -286,7 +288,19 @@ TESTCASES_ALL = [
         ["--out-dir", "missing.dir",
          "MYDIR/files/roles/role_no_parms/meta/argument_specs.yml"],
         1,
-        ["Cannot write output file"],
+        ["Cannot write output files: Output directory missing.dir is not an "
+         "existing directory"],
+        [],
+        None
+    ),
+    (
+        "Output directory that is a file",
+        False,
+        ["--out-dir", "MYDIR/files/spec_empty.yml",
+         "MYDIR/files/roles/role_no_parms/meta/argument_specs.yml"],
+        1,
+        ["Cannot write output files: Output directory .*spec_empty.yml is "
+         "not an existing directory"],
         [],
         None
     ),
@@ -340,6 +354,76 @@ TESTCASES_ALL = [
         [],
         "MYDIR/files/exp_docs/role_all_parms.md"
     ),
+    (
+        "role_no_parms_json (spec file in JSON format) with default format "
+        "rst",
+        True,
+        ["--out-dir", "TEMPDIR",
+         "MYDIR/files/roles/role_no_parms_json/meta/argument_specs.yml"],
+        0,
+        [],
+        [],
+        "MYDIR/files/exp_docs/role_no_parms_json.rst"
+    ),
+    (
+        "role_no_parms_json (spec file in JSON format) with --format md",
+        True,
+        ["--out-dir", "TEMPDIR", "--format", "md",
+         "MYDIR/files/roles/role_no_parms_json/meta/argument_specs.yml"],
+        0,
+        [],
+        [],
+        "MYDIR/files/exp_docs/role_no_parms_json.md"
+    ),
+    (
+        "Two role spec files with same template, verbose",
+        True,
+        ["--out-dir", "TEMPDIR", "--format", "md", "--verbose",
+         "MYDIR/files/roles/role_no_parms/meta/argument_specs.yml",
+         "MYDIR/files/roles/role_all_parms/meta/argument_specs.yml"],
+        0,
+        [
+            "Loading built-in template file: role.md.j2",
+            "Created output file: .*role_no_parms.md",
+            "Created output file: .*role_all_parms.md",
+        ],
+        [],
+        "MYDIR/files/exp_docs/role_all_parms.md"
+    ),
+    (
+        "Two playbook spec files loading schema files, messages in order",
+        True,
+        ["--out-dir", "TEMPDIR",
+         "MYDIR/files/playbooks/meta/"
+         "playbook_all_parms_schema_file_yaml.meta.yml",
+         "MYDIR/files/playbooks/meta/"
+         "playbook_all_parms_schema_file_json.meta.yml"],
+        0,
+        [
+            "Loading schema file for input parameters: .*_yaml_input.yml",
+            "Loading schema file for output parameters: .*_yaml_output.yml",
+            "Created output file: .*playbook_all_parms_schema_file_yaml.rst",
+            "Loading schema file for input parameters: .*_json_input.json",
+            "Loading schema file for output parameters: .*_json_output.json",
+            "Created output file: .*playbook_all_parms_schema_file_json.rst",
+        ],
+        [],
+        "MYDIR/files/exp_docs/playbook_all_parms_schema_file_json.rst"
+    ),
+    (
+        "Two spec files with the same output file",
+        True,
+        ["--out-dir", "TEMPDIR",
+         "MYDIR/files/roles/role_no_parms/meta/argument_specs.yml",
+         "MYDIR/files/roles/role_no_parms/meta/argument_specs.yml"],
+        0,
+        [
+            "Created output file: .*role_no_parms.rst",
+            "Created output file: .*role_no_parms.rst",
+        ],
+        [],
+        "MYDIR/files/exp_docs/role_no_parms.rst"
+    ),
     (
         "playbook_no_parms with default format rst",
         True,
@@ -704,3 +788,163 @@ def test_all(
     finally:
         if temp_dir is not None:
             shutil.rmtree(temp_dir)
+
+
+TESTCASES_RENDER_ERROR = [
+    # Testcases for test_render_error().
+
+    # Each item is a tuple with these items:
+    # - desc: Testcase description.
+    # - template (str): Path name of the template file, relative to the
+    #   directory of this test module.
+    # - exp_exc_type (type): Expected exception type that is raised by main(),
+    #   or None if main() is expected to return exit code 1.
+
+    (
+        "Template with undefined variable",
+        "files/templates/template_undefined_variable.j2",
+        None
+    ),
+    (
+        "Template with Python exception",
+        "files/templates/template_zero_division.j2",
+        ZeroDivisionError
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, template, exp_exc_type",
+    TESTCASES_RENDER_ERROR)
+def test_render_error(desc, template, exp_exc_type):
+    # pylint: disable=unused-argument
+    """
+    Test function for rendering errors, verifying that an existing output file
+    is kept unchanged and that no other files are left in the output
+    directory.
+    """
+    my_dir = os.path.dirname(__file__) or '.'
+    temp_dir = tempfile.mkdtemp(prefix="test_ansidte_")
+    try:
+        out_file = os.path.join(temp_dir, "foo.md")
+        with open(out_file, "w", encoding="utf-8") as f:
+            f.write("OLD DOCS\n")
+
+        saved_argv = sys.argv
+        sys.argv = [
+            "ansible-doc-template-extractor", "--out-dir", temp_dir,
+            "--type", "other", "--name", "foo", "--format", "md",
+            "--template", os.path.join(my_dir, template),
+            os.path.join(my_dir, "files", "spec_empty.yml")]
+        stdout = StringIO()
+        try:
+            with redirect_stdout(stdout):
+                if exp_exc_type:
+                    with pytest.raises(exp_exc_type):
+                        main()
+                else:
+                    rc = main()
+                    assert rc == 1
+                    assert "Could not render template file" in \
+                        stdout.getvalue()
+        finally:
+            sys.argv = saved_argv
+
+        assert read_file(out_file) == "OLD DOCS\n"
+        assert os.listdir(temp_dir) == ["foo.md"]
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+@pytest.mark.parametrize(
+    "verbose",
+    [False, True])
+def test_template_loaded_once(monkeypatch, verbose):
+    """
+    Test function that verifies that a template used by multiple spec files is
+    loaded only once, with serial (verbose) and concurrent processing.
+    """
+    my_dir = os.path.dirname(__file__) or '.'
+
+    loaded_names = []
+    orig_get_template = jinja2.Environment.get_template
+
+    def get_template(self, name, *args, **kwargs):
+        "Record the template name and delegate to the original method"
+        loaded_names.append(name)
+        return orig_get_template(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(jinja2.Environment, "get_template", get_template)
+
+    temp_dir = tempfile.mkdtemp(prefix="test_ansidte_")
+    try:
+        saved_argv = sys.argv
+        sys.argv = [
+            "ansible-doc-template-extractor", "--out-dir", temp_dir,
+            "--format", "md"]
+        if verbose:
+            sys.argv.append("--verbose")
+        for role in ("role_no_parms", "role_all_parms", "role_no_parms_json"):
+            sys.argv.append(os.path.join(
+                my_dir, "files", "roles", role, "meta", "argument_specs.yml"))
+        stdout = StringIO()
+        try:
+            with redirect_stdout(stdout):
+                rc = main()
+        finally:
+            sys.argv = saved_argv
+
+        assert rc == 0
+        assert loaded_names == ["role.md.j2"]
+        if verbose:
+            loading_lines = [
+                line for line in stdout.getvalue().splitlines()
+                if line.startswith("Loading built-in template file:")]
+            assert loading_lines == [
+                "Loading built-in template file: role.md.j2"]
+        assert sorted(os.listdir(temp_dir)) == [
+            "role_all_parms.md", "role_no_parms.md", "role_no_parms_json.md"]
+
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_same_output_file_ignoring_case(monkeypatch):
+    """
+    Test function that verifies that spec files whose output files differ
+    only in case are processed one after the other, because they are the
+    same file on a case-insensitive file system.
+    """
+    my_dir = os.path.dirname(__file__) or '.'
+
+    def thread_pool_executor(*args, **kwargs):
+        "Fail if spec files are processed concurrently"
+        raise AssertionError("Spec files are processed concurrently")
+
+    monkeypatch.setattr(
+        concurrent.futures, "ThreadPoolExecutor", thread_pool_executor)
+
+    temp_dir = tempfile.mkdtemp(prefix="test_ansidte_")
+    try:
+        saved_argv = sys.argv
+        sys.argv = ["ansible-doc-template-extractor", "--out-dir", temp_dir]
+        for coll_role in (("coll1", "role_case"), ("coll2", "Role_Case")):
+            sys.argv.append(os.path.join(
+                my_dir, "files", "collections", coll_role[0], "roles",
+                coll_role[1], "meta", "argument_specs.yml"))
+        stdout = StringIO()
+        try:
+            with redirect_stdout(stdout):
+                rc = main()
+        finally:
+            sys.argv = saved_argv
+
+        assert rc == 0
+        assert_lines(stdout.getvalue().splitlines(), [
+            "Created output file: .*role_case.rst",
+            "Created output file: .*Role_Case.rst",
+        ])
+
+    finally:
+        shutil.rmtree(temp_dir)
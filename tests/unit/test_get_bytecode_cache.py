@@ -0,0 +1,85 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit test module for get_bytecode_cache().
+"""
+
+import pytest
+
+from ansible_doc_template_extractor import cli
+from ansible_doc_template_extractor.cli import get_bytecode_cache
+
+ENV_OPTIONS = {"trim_blocks": True, "extensions": ["jinja2.ext.do"]}
+
+TESTCASES_GET_BYTECODE_CACHE = [
+    # Testcases for test_get_bytecode_cache().
+
+    # Each item is a tuple with these items:
+    # - desc: Testcase description.
+    # - version (str): Program version for the second cache.
+    # - env_options (dict): Jinja2 environment options for the second cache.
+    # - exp_same (bool): Expected to use the same cache file names as the
+    #   first cache (that uses version "1.0.0" and ENV_OPTIONS).
+
+    (
+        "Same version and options",
+        "1.0.0",
+        dict(ENV_OPTIONS),
+        True
+    ),
+    (
+        "Different version",
+        "1.1.0",
+        dict(ENV_OPTIONS),
+        False
+    ),
+    (
+        "Different option value",
+        "1.0.0",
+        dict(ENV_OPTIONS, trim_blocks=False),
+        False
+    ),
+    (
+        "Additional option",
+        "1.0.0",
+        dict(ENV_OPTIONS, lstrip_blocks=True),
+        False
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, version, env_options, exp_same",
+    TESTCASES_GET_BYTECODE_CACHE)
+def test_get_bytecode_cache(monkeypatch, desc, version, env_options, exp_same):
+    # pylint: disable=unused-argument
+    """
+    Test function for get_bytecode_cache(), verifying that the cache file
+    names depend on the program version and the Jinja2 environment options.
+    """
+    monkeypatch.setattr(cli, "version", "1.0.0")
+
+    # The code to be tested
+    cache1 = get_bytecode_cache(ENV_OPTIONS)
+
+    monkeypatch.setattr(cli, "version", version)
+
+    # The code to be tested
+    cache2 = get_bytecode_cache(env_options)
+
+    if cache1 is None or cache2 is None:
+        pytest.skip("No bytecode cache directory available")
+
+    assert (cache1.pattern == cache2.pattern) == exp_same
+    assert cache1.pattern.startswith("__ansible_doc_template_extractor_")
+    assert cache1.pattern.endswith("_%s.cache")
@@ -0,0 +1,190 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit test module for load_yaml_stream().
+"""
+
+import re
+from io import StringIO
+import pytest
+
+from ansible_doc_template_extractor import cli
+from ansible_doc_template_extractor.cli import load_yaml_stream, Error
+
+
+class OrjsonSpy:
+    """
+    Replacement for the orjson module that records the calls to loads().
+    """
+
+    def __init__(self, orjson):
+        self.orjson = orjson
+        self.JSONDecodeError = orjson.JSONDecodeError
+        self.loads_called = False
+
+    def loads(self, text):
+        "Record the call and delegate to orjson.loads()"
+        self.loads_called = True
+        return self.orjson.loads(text)
+
+
+TESTCASES_LOAD_YAML_STREAM = [
+    # Testcases for test_load_yaml_stream().
+
+    # Each item is a tuple with these items:
+    # - desc: Testcase description.
+    # - input_text (str): Content of the YAML file.
+    # - exp_result (object): Expected result, or None for failure.
+    # - exp_orjson_used (bool): Expected to be loaded with orjson, if orjson
+    #   is installed.
+    # - exp_exc_pattern (str): Expected regex pattern for the message of the
+    #   Error exception for failure, or None for success.
+
+    (
+        "YAML in block style",
+        "a: 1\nb: [x, y]\n",
+        {"a": 1, "b": ["x", "y"]},
+        False,
+        None
+    ),
+    (
+        "JSON object",
+        '{"a": 1, "b": ["x", "y"], "c": null, "d": true, "e": 0.5}',
+        {"a": 1, "b": ["x", "y"], "c": None, "d": True, "e": 0.5},
+        True,
+        None
+    ),
+    (
+        "JSON array with leading whitespace",
+        '\n  [1, "two"]',
+        [1, "two"],
+        True,
+        None
+    ),
+    (
+        "YAML in flow style that is not valid JSON",
+        "{a: 1}",
+        {"a": 1},
+        True,
+        None
+    ),
+    (
+        "JSON number with exponent (a string in YAML 1.1)",
+        '{"a": 1e3}',
+        {"a": "1e3"},
+        False,
+        None
+    ),
+    (
+        "JSON string with escape sequence",
+        '{"a": "x\\ty"}',
+        {"a": "x\ty"},
+        False,
+        None
+    ),
+    (
+        "JSON object with tab indentation",
+        '{\n\t"a": 1\n}',
+        {"a": 1},
+        False,
+        None
+    ),
+    (
+        "JSON integer wider than 64 bits (a float in orjson)",
+        '{"a": 12345678901234567890123}',
+        {"a": 12345678901234567890123},
+        False,
+        None
+    ),
+    (
+        "JSON string with DEL character (rejected by YAML)",
+        '{"a": "x\x7fy"}',
+        None,
+        False,
+        r"^test file has invalid YAML syntax: .*unacceptable character"
+    ),
+    (
+        "JSON string with C1 control character (rejected by YAML)",
+        '{"a": "x\x80y"}',
+        None,
+        False,
+        r"^test file has invalid YAML syntax: .*unacceptable character"
+    ),
+    (
+        "JSON string with NEL character (a line break in YAML)",
+        '{"a": "x\x85y"}',
+        {"a": "x y"},
+        False,
+        None
+    ),
+    (
+        "JSON string with U+FFFF non-character (rejected by YAML)",
+        '{"a": "x\uffffy"}',
+        None,
+        False,
+        r"^test file has invalid YAML syntax: .*unacceptable character"
+    ),
+    (
+        "Invalid YAML shows the file name",
+        "a: [\n",
+        None,
+        False,
+        r"^test file has invalid YAML syntax: .*in \"test.yml\""
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "use_orjson",
+    [False, True])
+@pytest.mark.parametrize(
+    "desc, input_text, exp_result, exp_orjson_used, exp_exc_pattern",
+    TESTCASES_LOAD_YAML_STREAM)
+def test_load_yaml_stream(
+        monkeypatch, desc, input_text, exp_result, exp_orjson_used,
+        exp_exc_pattern, use_orjson):
+    # pylint: disable=unused-argument
+    """
+    Test function for load_yaml_stream(), with and without orjson.
+
+    Tests that the result is the same with and without orjson, and that
+    orjson is used where expected.
+    """
+    if use_orjson:
+        orjson = pytest.importorskip("orjson")
+        spy = OrjsonSpy(orjson)
+        monkeypatch.setattr(cli, "orjson_module", lambda: spy)
+    else:
+        spy = None
+        monkeypatch.setattr(cli, "orjson_module", lambda: None)
+
+    fp = StringIO(input_text)
+    fp.name = "test.yml"
+
+    if exp_exc_pattern:
+        with pytest.raises(Error) as exc_info:
+
+            # The code to be tested
+            load_yaml_stream(fp, "test file")
+
+        exc_msg = str(exc_info.value)
+        assert re.search(exp_exc_pattern, exc_msg, re.M)
+    else:
+
+        # The code to be tested
+        result = load_yaml_stream(fp, "test file")
+
+        assert result == exp_result
+
+    if spy is not None:
+        assert spy.loads_called == exp_orjson_used
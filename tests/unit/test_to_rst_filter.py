@@ -25,7 +25,7 @@ TESTCASES_TO_RST_FILTER = [
 
     # Each item is a tuple with these items:
     # - desc: Testcase description.
-    # - input_text (str): Input text argument.
+    # - input_text (str or list of str): Input text argument.
     # - exp_result (str): Expected result, or None for failure.
     # - exp_exc_type (type): Expected exception type for failure, or None for
     #   success.
@@ -280,6 +280,13 @@ TESTCASES_TO_RST_FILTER = [
         None,
         None
     ),
+    (
+        "List of two lines",
+        ["The quick", "brown fox."],
+        "The quick\n\nbrown fox.",
+        None,
+        None
+    ),
 ]
 
 